@@ -1,32 +1,76 @@
 # -*- coding: utf-8 -*-
 """python card and deck"""
 
-import collections
+import array
+import itertools
 import random
+import sys
+import typing
 
-Card = collections.namedtuple('Card', ['rank', 'suit'])
+
+class Card(typing.NamedTuple):
+    """one poker card, an immutable rank and suit pair"""
+    rank: str
+    suit: str
 
 
 class FrenchDeck:
     """French Deck with 13 * 4 = 52 cards"""
-    ranks = [str(n) for n in range(2, 11)] + list('JQKA')
-    suits = ['spades', 'diamonds', 'clubs', 'hearts']
+    # immutable tuples of interned strings: cards built from these tables
+    # compare by identity first in dict lookups and equality checks
+    ranks = tuple(sys.intern(rank)
+                  for rank in [str(n) for n in range(2, 11)] + list('JQKA'))
+    suits = tuple(sys.intern(suit)
+                  for suit in ('spades', 'diamonds', 'clubs', 'hearts'))
+
+    # id tables to encode a card as one small integer: rank_id * 4 + suit_id
+    _rank_id = {rank: idx for idx, rank in enumerate(ranks)}
+    _suit_id = {suit: idx for idx, suit in enumerate(suits)}
+
+    # build the 52 codes only once at class scope
+    # every deck instance starts from a cheap copy of this template
+    _codes_template = array.array('B', [
+        rank_id * 4 + suit_id
+        for suit_id, rank_id in itertools.product(range(len(suits)), range(len(ranks)))
+    ])
 
     def __init__(self):
         """make all 52 cards and set protected"""
-        self._cards = [
-            Card(rank, suit)
-            for suit in self.suits
-            for rank in self.ranks
-        ]
+        # keep the deck as one compact uint8 buffer instead of 52 namedtuples
+        # Card objects are only synthesized on demand in __getitem__
+        self._codes = self._codes_template[:]
+
+    def _card(self, code):
+        """decode one uint8 code back to a Card"""
+        rank_id, suit_id = divmod(code, 4)
+        return Card(self.ranks[rank_id], self.suits[suit_id])
 
     def __len__(self):
         """set length of deck as count of cards"""
-        return len(self._cards)
+        return len(self._codes)
 
     def __getitem__(self, item):
         """allow indexing like deck[0]"""
-        return self._cards[item]
+        if isinstance(item, slice):
+            return [self._card(code) for code in self._codes[item]]
+        return self._card(self._codes[item])
+
+    def __contains__(self, item):
+        """encode the query card once, then scan the codes in one C loop"""
+        try:
+            rank, suit = item.rank, item.suit
+        except AttributeError:
+            # Card is a tuple, so plain (rank, suit) pairs compare equal
+            # to cards and must keep matching like the iteration fallback did
+            try:
+                rank, suit = item
+            except (TypeError, ValueError):
+                return False
+        try:
+            code = self._rank_id[rank] * 4 + self._suit_id[suit]
+        except (KeyError, TypeError):
+            return False
+        return code in self._codes
 
 
 # create deck instance
@@ -44,8 +88,8 @@ if cnt == len(deck):
     print('done loop')
 
 # in clause call __contains__
-# but when __contains__ is not defined, python use iter to find
-# so when __getitem__ and __len__ is defined, in clause is allowed
+# when __contains__ is not defined, python use iter to find
+# here __contains__ is defined, so the check is a single scan over the codes
 test_card = Card('7', 'diamonds')
 print(test_card in deck)
 
@@ -58,20 +102,32 @@ print(random.choice(deck))
 class FrenchDeckAdv(FrenchDeck):
     """advanced French Deck with more magic methods"""
 
-    def __contains__(self, item):
-        """make in clause more straightforward and efficient"""
-        return item in self._cards
-
     def __setitem__(self, key, value):
         """allow set item for shuffle"""
-        self._cards[key] = value
+        self._codes[key] = self._rank_id[value.rank] * 4 + self._suit_id[value.suit]
+
+    def shuffle(self, rnd=random.random):
+        """
+        in-place Fisher-Yates directly over the byte codes
+        random.shuffle(deck) works too, but pays 52 __getitem__/__setitem__
+            dispatches plus Card encode/decode per swap
+        rnd is bound as default to skip the module attribute lookup
+        """
+        codes = self._codes
+        for i in range(len(codes) - 1, 0, -1):
+            j = int(rnd() * (i + 1))
+            codes[i], codes[j] = codes[j], codes[i]
 
 
 deck = FrenchDeckAdv()
 
-# now in clause becomes more straightforward
+# in clause still works through the inherited __contains__
 print(test_card in deck)
 
 # random.shuffle is now allowed due to __setitem__
 random.shuffle(deck)
 print(deck[:3])
+
+# deck.shuffle swaps the codes directly, skipping dunder dispatch
+deck.shuffle()
+print(deck[:3])
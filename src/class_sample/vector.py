@@ -1,25 +1,52 @@
 # -*- coding: utf-8 -*-
 """doc string"""
 
-import math
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    # compile the dot product once with a preloaded signature
+    # hot loops of v1 * v2 then skip the interpreter entirely
+    @njit('float64(float64, float64, float64, float64)', cache=True)
+    def _dot(x1, y1, x2, y2):
+        return x1 * x2 + y1 * y2
+
+    _dot(0.0, 0.0, 0.0, 0.0)  # warm up at import so first use pays nothing
+else:
+    def _dot(x1, y1, x2, y2):
+        return x1 * x2 + y1 * y2
 
 
 class Vector2D:
     """2D vector with x and y"""
-    __slots__ = ['x', 'y']
+    __slots__ = ('x', 'y', '_abs')
 
     def __init__(self, x=0, y=0):
         self.x = x
         self.y = y
+        self._abs = None
 
     def __repr__(self):
         return f'Vector({repr(self.x)}, {repr(self.y)})'
 
     def __abs__(self):
-        return math.hypot(self.x, self.y)
+        # magnitude is cached lazily: all arithmetic returns new instances
+        # so x and y never change after __init__
+        if self._abs is None:
+            self._abs = (self.x * self.x + self.y * self.y) ** 0.5
+        return self._abs
 
     def __bool__(self):
-        return bool(abs(self))
+        # no need to compute the magnitude just to test truthiness
+        return self.x != 0 or self.y != 0
 
     def __add__(self, other):
         x = self.x + other.x
@@ -52,7 +79,7 @@ class Vector2DAdv(Vector2D):
 
     def __mul__(self, other):
         if isinstance(other, Vector2D):
-            return self.x * other.x + self.y * other.y
+            return _dot(self.x, self.y, other.x, other.y)
         return super().__mul__(other)
 
     def __neg__(self):
@@ -69,3 +96,54 @@ print(v1 < v2)
 
 v = Vector2DAdv(3, 4)
 print(- v)
+
+
+class Vector2DArray:
+    """
+    a batch of 2D vectors backed by one (N, 2) numpy array
+    bulk add / scale / dot run as single vectorized numpy calls
+        instead of one python object per vector per operation
+    """
+    __slots__ = ('_xy',)
+
+    def __init__(self, xy):
+        self._xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+
+    @classmethod
+    def from_iterable(cls, vectors):
+        """convert an iterable of Vector2D to one array in a single pass"""
+        xy = np.fromiter(
+            (coord for vec in vectors for coord in (vec.x, vec.y)),
+            dtype=np.float64,
+        )
+        return cls(xy)
+
+    def __len__(self):
+        return len(self._xy)
+
+    def __repr__(self):
+        return f'Vector2DArray({self._xy.tolist()})'
+
+    def __abs__(self):
+        """magnitudes of all vectors at once"""
+        return np.hypot(self._xy[:, 0], self._xy[:, 1])
+
+    def __add__(self, other):
+        return Vector2DArray(self._xy + other._xy)
+
+    def __mul__(self, scalar):
+        return Vector2DArray(self._xy * scalar)
+
+    def dot(self, other):
+        """pairwise dot products, one float per vector pair"""
+        return (self._xy * other._xy).sum(axis=1)
+
+
+# batch version of the Vector2D examples (skipped when numpy is missing)
+if np is not None:
+    va_1 = Vector2DArray.from_iterable([Vector2D(2, 1), Vector2D(3, 4)])
+    va_2 = Vector2DArray.from_iterable([Vector2D(2, 4), Vector2D(3, 4)])
+    print(va_1 + va_2)
+    print(va_1 * 3)
+    print(abs(va_1))
+    print(va_1.dot(va_2))
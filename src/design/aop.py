@@ -1,17 +1,18 @@
 # coding = utf-8
 """AOP - Aspect Oriented Programming"""
-__all__ = ['Advice', 'Context', 'register']
+__all__ = ['Advice', 'Context', 'register', 'register_simple']
 
-import contextlib
 import dataclasses
 import functools
 import inspect
 import traceback
+import types
 
+from contextvars import ContextVar
 from typing import List, Callable, Any
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class Context:
     """
     函数运行的上下文管理器，包含函数运行的基本信息
@@ -41,6 +42,86 @@ class Context:
         )).strip()
 
 
+# Context对象池：热点函数的每次调用不再新建dataclass实例
+# 池通过ContextVar按执行上下文隔离，线程和asyncio任务各自复用
+# 独立的Context栈，嵌套调用（如Tracer里B.main -> A.run）也互不干扰
+_ctx_pool: ContextVar[list] = ContextVar('_ctx_pool', default=None)
+_CTX_POOL_CAP = 64
+
+
+def _acquire_context(func, args, kwargs, throw=True):
+    """从当前上下文的对象池中取出（或新建）一个Context并重置其字段"""
+    pool = _ctx_pool.get()
+    if pool:
+        ctx = pool.pop()
+        ctx.func = func
+        ctx.args = args
+        ctx.kwargs = kwargs
+        ctx.success = False
+        ctx.result = None
+        ctx.exception = None
+        ctx.throw = throw
+        return ctx
+    return Context(func, args, kwargs, throw=throw)
+
+
+def _release_context(ctx):
+    """清空引用并归还当前上下文的对象池，调用后不可再读取该Context"""
+    ctx.func = None
+    ctx.args = ()
+    ctx.kwargs = {}
+    ctx.result = None
+    ctx.exception = None
+    pool = _ctx_pool.get()
+    if pool is None:
+        pool = []
+        _ctx_pool.set(pool)
+    if len(pool) < _CTX_POOL_CAP:
+        pool.append(ctx)
+
+
+def _fast_wraps(wrapper, func):
+    """
+    functools.wraps的精简版：只拷贝自省所需的四个属性
+    register_class装饰大类时每个方法都要拷贝一次，精简后装饰更快
+    保留__wrapped__和名称信息，示例中Tracer的func_name不受影响
+    """
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+class _GeneratorAdvice:
+    """
+    代替contextlib.contextmanager的轻量上下文管理器
+    register中被装饰函数的异常已写入context，不会传入__exit__，
+    因此无需contextmanager的generator throw/异常转发逻辑，
+    只需驱动advice generator的两段执行
+    """
+    __slots__ = ('_gen',)
+
+    def __init__(self, gen):
+        self._gen = gen
+
+    def __enter__(self):
+        # StopIteration不能逃出__enter__：在for/map等迭代中会被当作
+        # 迭代结束信号静默吞掉，这里与contextmanager一样转为RuntimeError
+        try:
+            next(self._gen)
+        except StopIteration:
+            raise RuntimeError('advice generator did not yield') from None
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            next(self._gen)
+        except StopIteration:
+            return False
+        raise RuntimeError('advice generator did not stop')
+
+
 def register(advice: Callable, **kwargs):
     """
     将某个自定义函数作为被装饰函数的生命周期
@@ -67,50 +148,129 @@ def register(advice: Callable, **kwargs):
     >>> def my_func():
     >>>     ...
     """
-    advice = contextlib.contextmanager(advice)
+    def decorator(func):
+        def wrapped_func(*_args, **_kwargs):
+            context = _acquire_context(func, _args, _kwargs)
+
+            try:
+                with _GeneratorAdvice(advice(context, **kwargs)):
+                    try:
+                        res = context.func(
+                            *context.args,
+                            **context.kwargs,
+                        )
+                    except Exception as e:
+                        context.success = False
+                        context.exception = e
+                    else:
+                        context.success = True
+                        context.result = res
+
+                # advice结束后读出所需字段，Context归还对象池后不可再使用
+                success = context.success
+                exception = context.exception
+                result = context.result
+                throw = context.throw
+            finally:
+                _release_context(context)
+
+            if not success and throw:
+                raise exception
+            return result
+
+        return _fast_wraps(wrapped_func, func)
 
+    return decorator
+
+
+def register_simple(before=None, after=None, throwing=None, throw=True):
+    """
+    register的特化版本：钩子是普通函数而非generator
+    跳过generator协议，直接内联try/except调用钩子，单次调用开销更低
+    适合只需要before/after/throwing组合的常见场景
+
+    Parameters
+    ----------
+    before: 被装饰函数执行前调用，入参为context
+    after: 被装饰函数执行后调用（无论成败），入参为context
+    throwing: 被装饰函数抛出异常后调用，入参为context
+    throw: 如果被装饰对象在运行期间出现异常，是否抛出
+
+    Examples
+    --------
+    >>> @register_simple(before=lambda ctx: print('start'))
+    >>> def my_func():
+    >>>     ...
+    """
     def decorator(func):
-        @functools.wraps(func)
         def wrapped_func(*_args, **_kwargs):
-            context = Context(func, _args, _kwargs)
+            context = _acquire_context(func, _args, _kwargs, throw=throw)
 
-            with advice(context, **kwargs):
+            try:
+                if before is not None:
+                    before(context)
                 try:
-                    res = context.func(
-                        *context.args,
-                        **context.kwargs,
-                    )
+                    res = func(*_args, **_kwargs)
                 except Exception as e:
                     context.success = False
                     context.exception = e
+                    if throwing is not None:
+                        throwing(context)
                 else:
                     context.success = True
                     context.result = res
+                if after is not None:
+                    after(context)
+
+                success = context.success
+                exception = context.exception
+                result = context.result
+                do_throw = context.throw
+            finally:
+                _release_context(context)
 
-            if not context.success and context.throw:
-                raise context.exception
-            return context.result
+            if not success and do_throw:
+                raise exception
+            return result
 
-        return wrapped_func
+        return _fast_wraps(wrapped_func, func)
 
     return decorator
 
 
+@functools.lru_cache(maxsize=256)
+def _class_callables(cls):
+    """
+    某个类上所有可调用成员的(名称, 对象)元组
+    inspect.getmembers要遍历整个MRO，开销大且结果只取决于类本身，
+    因此按类在模块级缓存一次，所有Advice实例与筛选器共享
+    """
+    return tuple(
+        (name, member)
+        for name, member in inspect.getmembers(cls)
+        if _callable(member)
+    )
+
+
 class _MethodFilter:
     """装饰整个类时，对类方法的筛选器，包含正选（SelectionFilter）和反选（ExceptionFilter）"""
     def __init__(self, klass, filter_list):
         self.cls = klass
         self.list = filter_list
+        # 类结构在装饰时已固定，筛选结果只需计算一次并缓存
+        self._cached_methods = tuple(self._compute_methods())
 
     @property
     def methods(self):
+        return self._cached_methods
+
+    def _compute_methods(self):
         raise NotImplementedError
 
 
 class _SelectionFilter(_MethodFilter):
     """正选类方法筛选器（默认）"""
-    @property
-    def methods(self):
+    def _compute_methods(self):
         for method_name in self.list:
             signature = getattr(self.cls, method_name)
             if _callable(signature):
@@ -119,12 +279,10 @@ class _SelectionFilter(_MethodFilter):
 
 class _ExceptionFilter(_MethodFilter):
     """反选类方法筛选器（默认）"""
-    @property
-    def methods(self):
-        for method_name, signature in inspect.getmembers(self.cls):
+    def _compute_methods(self):
+        for method_name, signature in _class_callables(self.cls):
             if (not method_name.startswith('__')) and \
-                    (method_name not in self.list) and \
-                    _callable(signature):
+                    (method_name not in self.list):
                 yield method_name
 
 
@@ -159,13 +317,16 @@ class Advice:
         """支持自定义的钩子函数：函数或方法运行报错后的操作"""
         pass
 
-    def register(self, throw=True):
+    def register(self, throw=True, _bind_context=False):
         """
         装饰一个函数或方法，使其应用生命周期
 
         Parameters
         ----------
         throw: 如果被装饰对象在运行期间出现异常，是否抛出
+        _bind_context: 内部参数，供register_instance使用
+            包装的是类字典里的原始函数时置True，调用时把首个位置参数
+            （即实例）绑定进context.func，钩子看到的仍是绑定方法
 
         Examples
         --------
@@ -183,16 +344,57 @@ class Advice:
         >>>     def my_method(self):
         >>>         ...
         """
+        # 装饰时按子类实际覆盖的钩子做特化：
+        # 未覆盖的钩子绑定为None，调用时直接跳过，不再空转一次方法分发
+        # 已覆盖的钩子绑定为闭包变量，省去每次调用的属性查找
+        # 注意：钩子在register时固定，装饰后再替换实例方法不会生效
+        cls = type(self)
+        before = self.before if cls.before is not Advice.before else None
+        after = self.after if cls.after is not Advice.after else None
+        returning = self.returning \
+            if cls.returning is not Advice.returning else None
+        throwing = self.throwing \
+            if cls.throwing is not Advice.throwing else None
+
         def decorator(func):
             if not _callable(func):
                 raise TypeError(f'{func} not callable')
 
-            @functools.wraps(func)
+            # 一个钩子都没覆盖且正常抛出异常时，生命周期完全是空转
+            # 直接返回原函数，装饰开销归零
+            if throw and before is after is returning is throwing is None:
+                return func
+
             def wrapped_func(*args, **kwargs):
-                context = Context(func, args, kwargs, throw=throw)
-                return self._life_cycle(context)
+                if _bind_context and args:
+                    # 按基线语义还原钩子视角：context.func是实例的绑定方法
+                    # （func_name等依赖__self__），args不含self
+                    context = Context(types.MethodType(func, args[0]),
+                                      args[1:], kwargs, throw=throw)
+                else:
+                    context = Context(func, args, kwargs, throw=throw)
+                if before is not None:
+                    before(context)
+                try:
+                    res = func(*args, **kwargs)
+                except Exception as exc:
+                    context.success = False
+                    context.exception = exc
+                    if throwing is not None:
+                        throwing(context)
+                    if context.throw:
+                        raise
+                else:
+                    context.success = True
+                    context.result = res
+                    if returning is not None:
+                        returning(context)
+                    return res
+                finally:
+                    if after is not None:
+                        after(context)
 
-            return wrapped_func
+            return _fast_wraps(wrapped_func, func)
 
         return decorator
 
@@ -224,16 +426,16 @@ class Advice:
         >>>     ...
         """
         def decorated_class(cls):
-            _args = (cls, selection, exception)
-            method_filter = self._filter(*_args)
+            method_filter = self._filter(cls, selection, exception)
             add_func = self.register(throw)
 
-            cls_name = cls.__name__
-            cls_base = (cls,)
-            cls_dict = dict(**cls.__dict__)
+            # 原地替换方法即可，无需拷贝整个类字典并用type重建新类
             for name in method_filter.methods:
-                cls_dict[name] = add_func(cls_dict[name])
-            return type(cls_name, cls_base, cls_dict)
+                raw = cls.__dict__.get(name)
+                if raw is None:  # 继承来的方法
+                    raw = getattr(cls, name)
+                setattr(cls, name, add_func(raw))
+            return cls
 
         return decorated_class
 
@@ -266,48 +468,61 @@ class Advice:
         """
         def decorated_class(cls):
             add_func = self.register(throw)
+            # 普通函数包装时走_bind_context：调用时把实例绑定进context.func，
+            # 钩子看到的仍是绑定方法（如B.run），与逐实例包装的基线行为一致
+            add_bound_func = self.register(throw, _bind_context=True)
+            wrapped_cache = {}  # 每个具体类只做一次筛选和包装
+
+            def _wrapped_table(klass):
+                """计算（并缓存）某个具体类的包装方法表"""
+                table = wrapped_cache.get(klass)
+                if table is None:
+                    method_filter = self._filter(klass, selection, exception)
+                    table = []
+                    for name in method_filter.methods:
+                        raw = getattr(klass, name)
+                        # 普通函数在实例初始化时再绑定
+                        # staticmethod/classmethod等描述符产物直接使用
+                        # getattr对静态方法同样返回普通函数，须按MRO回到
+                        # 定义类的__dict__里看原始条目才能区分二者
+                        needs_bind = _needs_bind(klass, name)
+                        wrapped = add_bound_func(raw) if needs_bind \
+                            else add_func(raw)
+                        table.append((name, wrapped, needs_bind))
+                    table = tuple(table)
+                    wrapped_cache[klass] = table
+                return table
+
+            original_init = cls.__init__
 
             def new_init(obj, *args, **kwargs):
-                cls.__init__(obj, *args, **kwargs)
-
-                _args = (obj.__class__, selection, exception)
-                method_filter = self._filter(*_args)
+                original_init(obj, *args, **kwargs)
 
-                for name in method_filter.methods:
-                    method = getattr(obj, name)
-                    traced_method = add_func(method)
+                klass = obj.__class__
+                for name, wrapped, needs_bind in _wrapped_table(klass):
+                    # 直接构造绑定方法，比经由__get__描述符协议再省一跳
+                    traced_method = types.MethodType(wrapped, obj) \
+                        if needs_bind else wrapped
                     setattr(obj, name, traced_method)
 
-            cls_name = cls.__name__
-            cls_base = (cls,)
-            cls_dict = dict(**cls.__dict__)
-            cls_dict['__init__'] = new_init
-            return type(cls_name, cls_base, cls_dict)
+            # 只替换__init__，原地装饰，无需拷贝类字典重建新类
+            cls.__init__ = new_init
+            return cls
 
         return decorated_class
 
-    def _life_cycle(self, context):
-        """实现生命周期"""
-        self.before(context)
-        try:
-            res = context.func(*context.args, **context.kwargs)
-        except Exception as exc:
-            context.success = False
-            context.exception = exc
-            self.throwing(context)
-            if context.throw:
-                raise exc
-        else:
-            context.success = True
-            context.result = res
-            self.returning(context)
-            return res
-        finally:
-            self.after(context)
-
     def _filter(self, cls, selection, exception):
-        return self.SelectionFilter(cls, selection) if selection \
-            else self.ExceptionFilter(cls, exception or [])
+        # 同一个类的重复装饰（尤其是register_instance逐实例筛选）直接复用缓存
+        key = (
+            cls,
+            tuple(selection) if selection else None,
+            tuple(exception) if exception else None,
+        )
+        cache = self.__dict__.setdefault('_filter_cache', {})
+        if key not in cache:
+            cache[key] = self.SelectionFilter(cls, selection) if selection \
+                else self.ExceptionFilter(cls, exception or [])
+        return cache[key]
 
 
 def _callable(obj):
@@ -315,6 +530,14 @@ def _callable(obj):
     return inspect.isfunction(obj) or inspect.ismethod(obj)
 
 
+def _needs_bind(cls, name):
+    """按MRO找到name在定义类字典中的原始条目，仅普通函数需按实例绑定"""
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return inspect.isfunction(base.__dict__[name])
+    return False
+
+
 if __name__ == '__main__':
     # 两个简单的例子
     try:
@@ -327,9 +550,14 @@ if __name__ == '__main__':
 
     print(Fore.RED + '示例1：函数运行监控器')
 
+    import weakref
     from collections import deque
 
-    def func_name(func: Callable):
+    # 函数对象不可变，名称解析结果按函数缓存，热路径上只剩一次字典查找
+    # WeakKeyDictionary不增加引用计数，动态生成的函数可正常回收（见memory_leak.py）
+    _name_cache = weakref.WeakKeyDictionary()
+
+    def _compute_func_name(func: Callable):
         if hasattr(func, '__self__'):  # 处理绑定方法
             return f'{func.__self__.__class__.__name__}.{func.__name__}'
         if hasattr(func, '__qualname__'):
@@ -339,6 +567,18 @@ if __name__ == '__main__':
                 return f'{name_list[-2]}.{name_list[-1]}'
         return func.__name__  # 处理函数
 
+    def func_name(func: Callable):
+        try:
+            return _name_cache[func]
+        except (KeyError, TypeError):  # 未缓存或func不支持弱引用
+            pass
+        name = _compute_func_name(func)
+        try:
+            _name_cache[func] = name
+        except TypeError:
+            pass
+        return name
+
     def _test_1_class():
         """示例1基于Advice class的实现"""
         class Tracer(Advice):
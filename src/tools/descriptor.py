@@ -1,24 +1,40 @@
 # coding = utf-8
 """descriptor"""
 
+import sys
+
 
 class Descriptor:
     """descriptor can easily create similar properties"""
 
     def __set_name__(self, owner, name):
-        self.name = name
+        # interned key lets every lookup take the pointer-compare fast path
+        self.name = sys.intern(name)
+        # values live under a shadow attribute, so owner classes may declare
+        # '_desc_<name>' in __slots__ and get C-level offset access
+        # without slots the shadow attribute simply lands in __dict__
+        # the derived key is interned too: it is the one actually hashed
+        # on every get/set, interning makes that an identity compare
+        self.slot = sys.intern('_desc_' + name)
 
     def __get__(self, instance, owner):
-        return instance.__dict__[self.name]
+        try:
+            return object.__getattribute__(instance, self.slot)
+        except AttributeError:
+            raise AttributeError(self.name) from None
 
     def __set__(self, instance, value):
-        instance.__dict__[self.name] = value
+        object.__setattr__(instance, self.slot, value)
 
     def __delete__(self, instance):
-        instance.__dict__.pop(self.name)
+        object.__delattr__(instance, self.slot)
 
 
 class TargetObject:
+    # slot the shadow attributes: no per-instance __dict__,
+    # and each descriptor access is a fixed-offset load
+    __slots__ = ('_desc_key', '_desc_value')
+
     key = Descriptor()
     value = Descriptor()
 
@@ -35,10 +51,18 @@ class TypeValidateDescriptor(Descriptor):
 
     def __init__(self, valid_type=None):
         self.valid_type = valid_type
+        # bind the check once so the hot setter skips the config branch
+        # exact-type match is a single pointer compare, isinstance (which
+        # walks the MRO) only runs as fallback for subclass instances
+        self._check = (lambda value: type(value) is valid_type
+                       or isinstance(value, valid_type)) \
+            if valid_type else None
 
     def __set__(self, instance, value):
-        if self.valid_type:
-            assert isinstance(value, self.valid_type)
+        # explicit raise instead of assert: validation survives python -O
+        if self._check is not None and not self._check(value):
+            raise TypeError(
+                f'{self.name} requires {self.valid_type}, not {type(value)}')
         super().__set__(instance, value)
 
 
@@ -63,17 +87,26 @@ class AdvancedDescriptor(Descriptor):
     def __init__(self, validate=None, resettable=True):
         self.validate = validate
         self.resettable = resettable
+        # dispatch the validation strategy once here
+        # instead of re-checking what validate is on every assignment
+        if isinstance(validate, type):
+            self._type_check = lambda value: type(value) is validate \
+                or isinstance(value, validate)
+        else:
+            self._type_check = None
 
     def __set__(self, instance, value):
-        if self.name in instance.__dict__ and not self.resettable:
+        if not self.resettable and hasattr(instance, self.slot):
             raise KeyError(f'{self.name} value cannot be reset')
-        if self.validate is not None:
-            if isinstance(self.validate, type):
-                assert isinstance(value, self.validate), \
-                    f'{self.name} requires {self.validate}, not {type(value)}'
-            elif callable(self.validate):
-                assert self.validate(value), \
-                    f'{self.name} does not pass func {self.validate.__name__}'
+        # explicit raises instead of asserts: validation survives python -O
+        if self._type_check is not None:
+            if not self._type_check(value):
+                raise TypeError(
+                    f'{self.name} requires {self.validate}, not {type(value)}')
+        elif self.validate is not None and callable(self.validate):
+            if not self.validate(value):
+                raise ValueError(
+                    f'{self.name} does not pass func {self.validate.__name__}')
         super().__set__(instance, value)
 
 
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """callable signatures"""
 
-import collections
 import functools
 import inspect
 
@@ -9,19 +8,36 @@ import inspect
 # here follows some tools based on signatures
 
 
+@functools.lru_cache(maxsize=1024)
+def _signature_parameters(func):
+    """
+    parse the signature only once per function
+    inspect.signature is expensive and a function's signature never changes,
+        so decorators calling this on every invocation get a cached tuple
+    """
+    return tuple(inspect.signature(func).parameters.values())
+
+
 def function_parameter(func, *args, **kwargs):
     """extract function parameters in ordered dict"""
-    # make result container (keep param order)
-    func_param = collections.OrderedDict()
-    # make signature and extract param part
-    sig_param = inspect.signature(func).parameters
-    # loop param and keep index, which can be used to parse args
-    for idx, param in enumerate(sig_param.values()):
-        # if param not in args or kwargs, use default value
-        val = args[idx] if idx < len(args) else \
-            kwargs.get(param.name, param.default)
-        # save value to result container
-        func_param[param.name] = val
+    # make result container (plain dict keeps insertion order since 3.7
+    # and skips OrderedDict's linked-list bookkeeping)
+    func_param = {}
+    # hoist the arg count, it is loop-invariant
+    n_args = len(args)
+    # loop cached params and keep index, which can be used to parse args
+    if kwargs:
+        for idx, param in enumerate(_signature_parameters(func)):
+            # if param not in args or kwargs, use default value
+            val = args[idx] if idx < n_args else \
+                kwargs.get(param.name, param.default)
+            func_param[param.name] = val
+    else:
+        # common decorator case: purely positional calls
+        # never hash a param name against an empty kwargs dict
+        for idx, param in enumerate(_signature_parameters(func)):
+            val = args[idx] if idx < n_args else param.default
+            func_param[param.name] = val
     # return result to function caller
     return func_param
 
@@ -29,12 +45,51 @@ def function_parameter(func, *args, **kwargs):
 
 
 # first define a function to convert param dict to string
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_describer(func):
+    """
+    synthesize a specialized formatter for one function
+    the signature is inspected only once; the generated closure reads
+        args by fixed position and kwargs/defaults by name,
+        no param dict is built at call time
+    returns None when the signature cannot be inspected
+    """
+    try:
+        params = _signature_parameters(func)
+    except (TypeError, ValueError):
+        return None
+    namespace = {}
+    parts = []
+    for idx, param in enumerate(params):
+        # default values are passed in through the exec namespace
+        namespace[f'_d{idx}'] = param.default
+        parts.append(
+            f"{param.name}="
+            f"{{(args[{idx}] if {idx} < _n else "
+            f"kwargs.get('{param.name}', _d{idx}))!r}}"
+        )
+    source = (
+        "def describe(*args, **kwargs):\n"
+        "    _n = len(args)\n"
+        f"    return f\"{func.__name__}({', '.join(parts)})\"\n"
+    )
+    exec(source, namespace)
+    return namespace['describe']
+
+
 def calling_description(func, *args, **kwargs):
     """return a string including function name and parameter values"""
-    param = function_parameter(func, *args, **kwargs)
-    param_lst = [f"{k}={repr(v)}" for k, v in param.items()]
-    param_str = ', '.join(param_lst)
-    return f"{func.__name__}({param_str})"
+    describer = _make_describer(func)
+    if describer is None:
+        # generic fallback for callables without an inspectable signature
+        # the gen-exp feeds join without an intermediate list, and !r is a
+        # single format opcode instead of a global repr() lookup and call
+        param = function_parameter(func, *args, **kwargs)
+        param_str = ', '.join(f'{k}={v!r}' for k, v in param.items())
+        return f"{func.__name__}({param_str})"
+    return describer(*args, **kwargs)
 
 
 # then, define the target decorator